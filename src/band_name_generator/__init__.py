@@ -1,7 +1,28 @@
 """Band Name Generator - Create random band names with multiple words."""
 
-from .generator import BandNameGenerator
-from .patterns import BandNamePattern
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .generator import BandNameGenerator
+    from .patterns import BandNamePattern
 
 __version__ = "0.1.0"
 __all__ = ["BandNameGenerator", "BandNamePattern"]
+
+
+def __getattr__(name: str) -> object:
+    """Import public classes lazily on first attribute access (PEP 562).
+
+    Keeps `import band_name_generator` (and therefore CLI startup) from
+    loading the generator and word fetcher until they are actually used.
+    """
+    if name == "BandNameGenerator":
+        from .generator import BandNameGenerator
+
+        return BandNameGenerator
+    if name == "BandNamePattern":
+        from .patterns import BandNamePattern
+
+        return BandNamePattern
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
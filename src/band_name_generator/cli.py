@@ -12,14 +12,46 @@ Usage:
     python -m band_name_generator --random           # Continuous random mode
 """
 
-import argparse
+import functools
 import signal
 import sys
 import time
+from collections import deque
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-from .generator import BandNameGenerator
 from .patterns import BandNamePattern
 
+if TYPE_CHECKING:
+    import argparse
+
+    from .generator import BandNameGenerator
+
+
+# Number of names generated at a time in random mode
+RANDOM_MODE_BATCH = 32
+
+# Command-line flags understood by _parse_args(): option string -> destination
+_FLAGS = {
+    "-l": "list_patterns",
+    "--list-patterns": "list_patterns",
+    "-r": "random",
+    "--random": "random",
+    "-v": "verbose",
+    "--verbose": "verbose",
+}
+
+# Options taking a value: option string -> (destination, converter)
+_OPTIONS: dict[str, tuple[str, Callable[[str], object]]] = {
+    "-n": ("count", int),
+    "--count": ("count", int),
+    "-p": ("pattern", str),
+    "--pattern": ("pattern", str),
+    "-i": ("interval", float),
+    "--interval": ("interval", float),
+}
+
 
 def main() -> int:
     """Main CLI entry point for the band name generator.
@@ -30,6 +62,9 @@ def main() -> int:
     2. Pattern mode (-p/--pattern): Generate names using a specific pattern
     3. Random mode (default): Generate names using random patterns
 
+    Well-formed command lines are parsed by _parse_args() without importing
+    argparse; argparse is only built for --help and error reporting.
+
     Command-line Arguments:
         -n, --count (int): Number of band names to generate (default: 1)
         -p, --pattern (str): Specific pattern to use (optional)
@@ -51,6 +86,100 @@ def main() -> int:
           2. Steel Dragon
           ...
     """
+    argv = sys.argv[1:]
+
+    # Parse command-line arguments, falling back to argparse for --help,
+    # unknown flags, and malformed values so its messages are preserved
+    parsed = _parse_args(argv)
+    args = parsed if parsed is not None else _build_parser().parse_args(argv)
+
+    # Convert pattern string to enum if specified, otherwise None for random.
+    # Validated here rather than via choices= so the lookup table is only
+    # built when a pattern was actually given.
+    pattern: BandNamePattern | None = None
+    if args.pattern is not None:
+        pattern = _pattern_map().get(args.pattern)
+        if pattern is None:
+            _build_parser().error(
+                f"argument -p/--pattern: invalid choice: {args.pattern!r} "
+                f"(choose from {', '.join(_pattern_map())})"
+            )
+
+    # Handle list patterns mode - display all patterns and exit
+    if args.list_patterns:
+        return _list_patterns()
+
+    # Get the band name generator instance
+    generator = _get_generator(verbose=args.verbose)
+
+    # Handle random continuous mode
+    if args.random:
+        # In random mode: None means infinite, otherwise use specified count
+        count = args.count if args.count is not None else 0
+        return run_random_mode(generator, pattern, count, args.interval)
+
+    # For normal mode: default to 1 if count not specified
+    count = args.count if args.count is not None else 1
+
+    # Generate the requested number of band names and display them
+    _print_names(generator.generate(pattern=pattern, count=count))
+    return 0
+
+
+def _parse_args(argv: list[str]) -> SimpleNamespace | None:
+    """Parse command-line arguments in a single pass without argparse.
+
+    Handles the flags and options defined by _build_parser() in the forms
+    "-n 5", "--count 5" and "--count=5". Anything else (help, unknown or
+    abbreviated flags, missing or invalid values) returns None so the
+    caller can defer to argparse for the exact same behavior and messages.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        Parsed arguments with the same attributes as the argparse namespace,
+        or None if argparse should handle this command line
+    """
+    args = SimpleNamespace(
+        count=None,
+        pattern=None,
+        list_patterns=False,
+        random=False,
+        interval=5.0,
+        verbose=False,
+    )
+    it = iter(argv)
+    for arg in it:
+        name, sep, value = arg.partition("=") if arg.startswith("--") else (arg, "", "")
+        if name in _FLAGS and not sep:
+            setattr(args, _FLAGS[name], True)
+        elif name in _OPTIONS:
+            dest, convert = _OPTIONS[name]
+            if not sep:
+                value = next(it, "-")
+            if value.startswith("-"):
+                # Missing value or a negative number: let argparse decide
+                return None
+            try:
+                setattr(args, dest, convert(value))
+            except ValueError:
+                return None
+        else:
+            return None
+    return args
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the full (non fast-path) CLI.
+
+    argparse is imported here so the fast paths in main() never load it.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    import argparse
+
     # Set up argument parser with help text and examples
     parser = argparse.ArgumentParser(
         description="Generate random band names like Depeche Mode, Iron Maiden, Limp Bizkit",
@@ -81,8 +210,8 @@ Examples:
         "-p",
         "--pattern",
         type=str,
-        choices=[p.value for p in BandNamePattern],
-        help="Specific pattern to use (random if not specified)",
+        metavar="PATTERN",
+        help="Specific pattern to use (random if not specified, see -l for choices)",
     )
 
     # Add argument for listing available patterns
@@ -118,58 +247,77 @@ Examples:
         help="Enable verbose debug output (shows word fetching details)",
     )
 
-    # Parse command-line arguments
-    args = parser.parse_args()
+    return parser
 
-    # Handle list patterns mode - display all patterns and exit
-    if args.list_patterns:
-        print("Available patterns:")
-        print("\nTwo-word patterns:")
-        # Display two-word patterns (e.g., adjective_noun, metal_noun)
-        for p in BandNamePattern.two_word_patterns():
-            print(f"  - {p.value}")
-        print("\nMulti-word patterns:")
-        # Display multi-word patterns not already shown in two-word section
-        for p in BandNamePattern.multi_word_patterns():
-            if p not in BandNamePattern.two_word_patterns():
-                print(f"  - {p.value}")
-        return 0
 
-    # Create the band name generator instance
-    generator = BandNameGenerator(verbose=args.verbose)
+@functools.cache
+def _pattern_map() -> dict[str, BandNamePattern]:
+    """Return the mapping of pattern values (e.g., "metal_noun") to enum members.
 
-    # Convert pattern string to enum if specified, otherwise None for random
-    pattern: BandNamePattern | None = None
-    if args.pattern:
-        # Convert the string value (e.g., "metal_noun") to enum
-        pattern = BandNamePattern(args.pattern)
+    Built once per process and used both to validate -p/--pattern and to
+    convert it, instead of going through the BandNamePattern(value) lookup.
 
-    # Handle random continuous mode
-    if args.random:
-        # In random mode: None means infinite, otherwise use specified count
-        count = args.count if args.count is not None else 0
-        return run_random_mode(generator, pattern, count, args.interval)
+    Returns:
+        Dict of pattern value to BandNamePattern
+    """
+    return {p.value: p for p in BandNamePattern}
 
-    # For normal mode: default to 1 if count not specified
-    count = args.count if args.count is not None else 1
 
-    # Generate the requested number of band names
-    names = generator.generate(pattern=pattern, count=count)
+@functools.lru_cache(maxsize=1)
+def _get_generator(verbose: bool = False) -> BandNameGenerator:
+    """Return the process-wide generator, creating it on first use.
 
-    # Display results with appropriate formatting
-    print()
-    if count == 1:
+    The generator module is imported here rather than at the top of this
+    module, so -l/--list-patterns and --help never load the word lists or
+    the HTTP client.
+
+    Args:
+        verbose: If True, enables debug output for word fetching
+
+    Returns:
+        Shared BandNameGenerator instance
+    """
+    from .generator import BandNameGenerator
+
+    return BandNameGenerator(verbose=verbose)
+
+
+def _list_patterns() -> int:
+    """Print all available patterns, grouped into two-word and multi-word.
+
+    Returns:
+        Exit code (always 0)
+    """
+    two_word = frozenset(BandNamePattern.two_word_patterns())
+    print("Available patterns:")
+    print("\nTwo-word patterns:")
+    # Display two-word patterns (e.g., adjective_noun, metal_noun)
+    for p in BandNamePattern.two_word_patterns():
+        print(f"  - {p.value}")
+    print("\nMulti-word patterns:")
+    # Display multi-word patterns not already shown in two-word section
+    for p in BandNamePattern.multi_word_patterns():
+        if p not in two_word:
+            print(f"  - {p.value}")
+    return 0
+
+
+def _print_names(names: list[str]) -> None:
+    """Print generated band names in the normal (non-random) output format.
+
+    Args:
+        names: Generated band names to display
+    """
+    if len(names) == 1:
         # Single name: simpler output format
-        print("Generated band name:")
-        print(f"  {names[0]}")
+        lines = ["Generated band name:", f"  {names[0]}"]
     else:
         # Multiple names: numbered list format
-        print(f"Generated {count} band names:")
-        for i, name in enumerate(names, 1):
-            print(f"  {i}. {name}")
-    print()
+        lines = [f"Generated {len(names)} band names:"]
+        lines.extend(f"  {i}. {name}" for i, name in enumerate(names, 1))
 
-    return 0
+    # Emit everything with a single write instead of one print() per line
+    sys.stdout.write("\n" + "\n".join(lines) + "\n\n")
 
 
 def run_random_mode(
@@ -207,29 +355,34 @@ def run_random_mode(
     else:
         print(f"Generating names continuously with {interval}s intervals [Press Ctrl+C to stop]\n")
 
-    # Generate names in a loop
+    # Generate names in a loop, scheduling each one against a fixed deadline
+    # so the time spent generating does not accumulate as drift
     iteration = 0
+    deadline = time.monotonic()
+    buffer: deque[str] = deque()
     while True:
         iteration += 1
 
-        # Generate one name
-        names = generator.generate(pattern=pattern, count=1)
+        # Refill the buffer in batches so generate() is called once per
+        # batch rather than once per name (never more than count needs)
+        if not buffer:
+            batch = (
+                RANDOM_MODE_BATCH if count <= 0 else min(RANDOM_MODE_BATCH, count - iteration + 1)
+            )
+            buffer.extend(generator.generate(pattern=pattern, count=batch))
 
-        # Display the name
-        print("Generated band name:")
-        print(f"  {names[0]}")
-        print()
+        # Display the next name
+        sys.stdout.write(f"Generated band name:\n  {buffer.popleft()}\n\n")
 
         # Check if we've reached the count limit
         if count > 0 and iteration >= count:
             print(f"Generated {count} names. Exiting.")
             break
 
-        # Pause before next iteration
-        try:
-            time.sleep(interval)
-        except KeyboardInterrupt:
-            print("\n\nRandom mode stopped by user.")
-            return 0
+        # Pause until the next deadline (Ctrl+C is handled by signal_handler).
+        # After a stall (e.g. a suspended terminal) the deadline restarts from
+        # now, so pacing resumes instead of printing the missed names in a burst
+        deadline = max(deadline + interval, time.monotonic())
+        time.sleep(max(0.0, deadline - time.monotonic()))
 
     return 0
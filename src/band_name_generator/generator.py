@@ -1,9 +1,110 @@
 """Main band name generator logic."""
 
+import functools
 import random
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from .patterns import MULTI_WORD_PATTERNS, BandNamePattern
+from .word_fetcher import (
+    CATEGORIES_CAP,
+    NUMPY_MIN_COUNT,
+    WordFetcher,
+    get_fetcher,
+    pluralize,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# How each pattern is assembled: a format template and the word category
+# filling each placeholder, in order. The single definition of every pattern;
+# both the per-name assemblers and the NumPy bulk path are built from it.
+_RECIPES: dict[BandNamePattern, tuple[str, tuple[str, ...]]] = {
+    BandNamePattern.ADJECTIVE_NOUN: ("{} {}", ("adjective", "noun")),
+    BandNamePattern.COLOR_NOUN: ("{} {}", ("color", "noun")),
+    BandNamePattern.METAL_NOUN: ("{} {}", ("metal", "noun")),
+    BandNamePattern.VERB_NOUN: ("{} {}", ("verb", "noun")),
+    BandNamePattern.NOUN_NOUN: ("{} {}", ("noun", "noun")),
+    BandNamePattern.THE_ADJECTIVE_NOUN: ("The {} {}", ("adjective", "noun_plural")),
+    BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN: ("{} {} {}", ("adjective", "adjective", "noun")),
+    BandNamePattern.ADJECTIVE_NOUN_PLURAL: ("{} {}", ("adjective", "noun_plural")),
+    BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN_PLURAL: (
+        "{} {} {} {}",
+        ("adjective", "adjective", "noun", "noun_plural"),
+    ),
+    BandNamePattern.COLOR_ADJECTIVE_NOUN_PLURAL: (
+        "{} {} {} {}",
+        ("color", "adjective", "noun", "noun_plural"),
+    ),
+}
+
+# Draws one word from a table; the bound choice() method of the generator's
+# random.Random instance, passed into every assembler call
+_Choice = Callable[[Sequence[str]], str]
+
+
+def _make_assembler(template: str, slots: tuple[str, ...]) -> Callable[[_Choice], str]:
+    """
+    Build a function that assembles one name from a recipe.
+
+    The template's literal text and the slots' pre-capitalized word tables
+    are bound into a closure with a fixed f-string, so a call does no
+    template parsing or table lookups, just one choice() per word.
+
+    Args:
+        template: Format template with one "{}" per slot.
+        slots: Word category filling each placeholder, in order.
+
+    Returns:
+        Function taking a choice() callable and returning a band name.
 
-from .patterns import BandNamePattern
-from .word_fetcher import WordFetcher
+    Raises:
+        ValueError: If the recipe does not have 2, 3 or 4 slots.
+    """
+    literals = template.split("{}")
+    tables = [CATEGORIES_CAP[slot] for slot in slots]
+    if len(tables) == 2:
+        p0, p1, p2 = literals
+        t0, t1 = tables
+        return lambda choice: f"{p0}{choice(t0)}{p1}{choice(t1)}{p2}"
+    if len(tables) == 3:
+        p0, p1, p2, p3 = literals
+        t0, t1, t2 = tables
+        return lambda choice: f"{p0}{choice(t0)}{p1}{choice(t1)}{p2}{choice(t2)}{p3}"
+    if len(tables) == 4:
+        p0, p1, p2, p3, p4 = literals
+        t0, t1, t2, t3 = tables
+        return lambda choice: (
+            f"{p0}{choice(t0)}{p1}{choice(t1)}{p2}{choice(t2)}{p3}{choice(t3)}{p4}"
+        )
+    msg = f"Recipe {template!r} has {len(tables)} slots; only 2-4 are supported"
+    raise ValueError(msg)
+
+
+# Builds a single name for each pattern straight from the pre-capitalized
+# word tables. Read-only, shared by generate_by_pattern() and the
+# generate_* methods, which all route through it.
+_ASSEMBLERS: Mapping[BandNamePattern, Callable[[_Choice], str]] = MappingProxyType(
+    {pattern: _make_assembler(*recipe) for pattern, recipe in _RECIPES.items()}
+)
+
+# Assemblers of the multi-word patterns in MULTI_WORD_PATTERNS order, so
+# generate() can pick patterns by integer index
+_ASSEMBLER_TUPLE: tuple[Callable[[_Choice], str], ...] = tuple(
+    _ASSEMBLERS[p] for p in MULTI_WORD_PATTERNS
+)
+_ASSEMBLER_INDICES = range(len(_ASSEMBLER_TUPLE))
+
+
+@functools.cache
+def _word_arrays() -> dict[str, np.ndarray[Any, Any]]:
+    """Return the capitalized category lists as NumPy object arrays (built once)."""
+    import numpy as np
+
+    return {category: np.array(words, dtype=object) for category, words in CATEGORIES_CAP.items()}
 
 
 class BandNameGenerator:
@@ -15,7 +116,9 @@ class BandNameGenerator:
     and Black Sabbath (color+noun).
 
     Attributes:
-        word_fetcher: WordFetcher instance used to retrieve random words.
+        word_fetcher: WordFetcher instance used to retrieve random words. Its
+            random.Random instance (word_fetcher.rng) drives every choice
+            the generator makes.
 
     Example:
         >>> generator = BandNameGenerator()
@@ -24,39 +127,43 @@ class BandNameGenerator:
         5
     """
 
-    def __init__(self, verbose: bool = False) -> None:
+    __slots__ = ("word_fetcher",)
+
+    def __init__(
+        self, verbose: bool = False, seed: int | None = None, fast_mode: bool = True
+    ) -> None:
         """
         Initialize the band name generator.
 
-        Creates a WordFetcher instance that will be used to retrieve
-        random words for all name generation methods.
+        Uses the shared WordFetcher (see get_fetcher()) to retrieve random
+        words for all name generation methods, or a private one when a seed
+        or fast_mode=False is given so the generator's sequence is its own.
+        Unseeded generators therefore share one rng with each other.
 
         Args:
             verbose: If True, enables debug output for word fetching.
-        """
-        self.word_fetcher = WordFetcher(verbose=verbose)
-
-    def _capitalize_band_name(self, name: str) -> str:
-        """
-        Capitalize each word in the band name.
-
-        Args:
-            name: The band name to capitalize (e.g., "iron maiden").
-
-        Returns:
-            Band name with each word capitalized (e.g., "Iron Maiden").
+            seed: Optional seed for the random number generator. Generators
+                created with the same seed produce the same names, with or
+                without NumPy: seeded generators never use the NumPy path.
+            fast_mode: If False, draw from random.SystemRandom instead of the
+                default random.Random (see WordFetcher); the NumPy bulk path
+                is then not used either.
 
-        Example:
-            >>> generator._capitalize_band_name("dark storm")
-            'Dark Storm'
+        Raises:
+            ValueError: If a seed is given with fast_mode=False.
         """
-        return " ".join(word.capitalize() for word in name.split())
+        if seed is None and fast_mode:
+            self.word_fetcher = get_fetcher(verbose)
+        else:
+            self.word_fetcher = WordFetcher(verbose=verbose, seed=seed, fast_mode=fast_mode)
 
     def _pluralize(self, word: str) -> str:
         """
         Simple pluralization (not perfect, but good enough).
 
-        Handles common pluralization rules:
+        Delegates to word_fetcher.pluralize(). The built-in nouns are
+        pluralized once at import (see NOUNS_PLURAL), so this is only
+        needed for other words. Handles common pluralization rules:
         - Words ending in s, x, z, ch, sh → add "es"
         - Words ending in consonant + y → change y to "ies"
         - All other words → add "s"
@@ -75,21 +182,13 @@ class BandNameGenerator:
             >>> generator._pluralize("city")
             'cities'
         """
-        if word.endswith(("s", "x", "z", "ch", "sh")):
-            # Words ending in sibilants need "es"
-            return word + "es"
-        elif word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
-            # Consonant + y → ies
-            return word[:-1] + "ies"
-        else:
-            # Default: add "s"
-            return word + "s"
+        return pluralize(word)
 
     def generate_adjective_noun(self) -> str:
         """Generate a two-word band name: Adjective + Noun.
 
         Creates names in the style of bands like "Silent Thunder" or "Dark Storm".
-        Fetches a random adjective and noun, then capitalizes each word.
+        Fetches a random adjective and noun and capitalizes each word.
 
         Returns:
             Capitalized band name (e.g., "Electric Mountain", "Broken Wolf").
@@ -100,11 +199,7 @@ class BandNameGenerator:
             >>> len(name.split())
             2
         """
-        # Get random adjective and noun from word fetcher
-        adj = self.word_fetcher.get_adjective()
-        noun = self.word_fetcher.get_noun()
-        # Combine and capitalize each word
-        return self._capitalize_band_name(f"{adj} {noun}")
+        return _ASSEMBLERS[BandNamePattern.ADJECTIVE_NOUN](self.word_fetcher.rng.choice)
 
     def generate_color_noun(self) -> str:
         """Generate a two-word band name: Color + Noun.
@@ -121,11 +216,7 @@ class BandNameGenerator:
             >>> len(name.split())
             2
         """
-        # Get random color and noun from word fetcher
-        color = self.word_fetcher.get_color()
-        noun = self.word_fetcher.get_noun()
-        # Combine and capitalize each word
-        return self._capitalize_band_name(f"{color} {noun}")
+        return _ASSEMBLERS[BandNamePattern.COLOR_NOUN](self.word_fetcher.rng.choice)
 
     def generate_metal_noun(self) -> str:
         """Generate a two-word band name: Metal + Noun.
@@ -142,11 +233,7 @@ class BandNameGenerator:
             >>> len(name.split())
             2
         """
-        # Get random metal and noun from word fetcher
-        metal = self.word_fetcher.get_metal()
-        noun = self.word_fetcher.get_noun()
-        # Combine and capitalize each word
-        return self._capitalize_band_name(f"{metal} {noun}")
+        return _ASSEMBLERS[BandNamePattern.METAL_NOUN](self.word_fetcher.rng.choice)
 
     def generate_verb_noun(self) -> str:
         """Generate a two-word band name: Verb + Noun.
@@ -163,11 +250,7 @@ class BandNameGenerator:
             >>> len(name.split())
             2
         """
-        # Get random verb (usually -ing form) and noun from word fetcher
-        verb = self.word_fetcher.get_verb()
-        noun = self.word_fetcher.get_noun()
-        # Combine and capitalize each word
-        return self._capitalize_band_name(f"{verb} {noun}")
+        return _ASSEMBLERS[BandNamePattern.VERB_NOUN](self.word_fetcher.rng.choice)
 
     def generate_noun_noun(self) -> str:
         """Generate a two-word band name: Noun + Noun.
@@ -184,11 +267,7 @@ class BandNameGenerator:
             >>> len(name.split())
             2
         """
-        # Get two random nouns from word fetcher
-        noun1 = self.word_fetcher.get_noun()
-        noun2 = self.word_fetcher.get_noun()
-        # Combine and capitalize each word
-        return self._capitalize_band_name(f"{noun1} {noun2}")
+        return _ASSEMBLERS[BandNamePattern.NOUN_NOUN](self.word_fetcher.rng.choice)
 
     def generate_the_adjective_noun(self) -> str:
         """Generate a three-word band name: The + Adjective + Noun (plural).
@@ -205,11 +284,7 @@ class BandNameGenerator:
             >>> name.startswith("The ")
             True
         """
-        # Get random adjective and noun, pluralize the noun
-        adj = self.word_fetcher.get_adjective()
-        noun = self._pluralize(self.word_fetcher.get_noun())
-        # Combine with "the" prefix and capitalize each word
-        return self._capitalize_band_name(f"the {adj} {noun}")
+        return _ASSEMBLERS[BandNamePattern.THE_ADJECTIVE_NOUN](self.word_fetcher.rng.choice)
 
     def generate_adjective_adjective_noun(self) -> str:
         """Generate a three-word band name: Adjective + Adjective + Noun.
@@ -226,12 +301,7 @@ class BandNameGenerator:
             >>> len(name.split())
             3
         """
-        # Get two random adjectives and one noun from word fetcher
-        adj1 = self.word_fetcher.get_adjective()
-        adj2 = self.word_fetcher.get_adjective()
-        noun = self.word_fetcher.get_noun()
-        # Combine all three and capitalize each word
-        return self._capitalize_band_name(f"{adj1} {adj2} {noun}")
+        return _ASSEMBLERS[BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN](self.word_fetcher.rng.choice)
 
     def generate_adjective_noun_plural(self) -> str:
         """Generate a two-word band name: Adjective + Noun (plural).
@@ -248,11 +318,7 @@ class BandNameGenerator:
             >>> len(name.split())
             2
         """
-        # Get random adjective and noun, pluralize the noun
-        adj = self.word_fetcher.get_adjective()
-        noun = self._pluralize(self.word_fetcher.get_noun())
-        # Combine and capitalize each word
-        return self._capitalize_band_name(f"{adj} {noun}")
+        return _ASSEMBLERS[BandNamePattern.ADJECTIVE_NOUN_PLURAL](self.word_fetcher.rng.choice)
 
     def generate_adjective_adjective_noun_plural(self) -> str:
         """Generate a four-word band name: Adjective + Adjective + Noun + Noun (plural).
@@ -270,13 +336,9 @@ class BandNameGenerator:
             >>> len(name.split())
             4
         """
-        # Get two random adjectives and two nouns, pluralize the second noun
-        adj1 = self.word_fetcher.get_adjective()
-        adj2 = self.word_fetcher.get_adjective()
-        noun1 = self.word_fetcher.get_noun()
-        noun2 = self._pluralize(self.word_fetcher.get_noun())
-        # Combine all four words and capitalize each
-        return self._capitalize_band_name(f"{adj1} {adj2} {noun1} {noun2}")
+        return _ASSEMBLERS[BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN_PLURAL](
+            self.word_fetcher.rng.choice
+        )
 
     def generate_color_adjective_noun_plural(self) -> str:
         """Generate a four-word band name: Color + Adjective + Noun + Noun (plural).
@@ -294,20 +356,15 @@ class BandNameGenerator:
             >>> len(name.split())
             4
         """
-        # Get color, adjective, and two nouns, pluralize the second noun
-        color = self.word_fetcher.get_color()
-        adj = self.word_fetcher.get_adjective()
-        noun1 = self.word_fetcher.get_noun()
-        noun2 = self._pluralize(self.word_fetcher.get_noun())
-        # Combine all four words and capitalize each
-        return self._capitalize_band_name(f"{color} {adj} {noun1} {noun2}")
+        return _ASSEMBLERS[BandNamePattern.COLOR_ADJECTIVE_NOUN_PLURAL](
+            self.word_fetcher.rng.choice
+        )
 
     def generate_by_pattern(self, pattern: BandNamePattern) -> str:
         """Generate a band name using a specific pattern.
 
-        Maps a BandNamePattern enum value to its corresponding generator method
-        and calls it to produce a band name. This is the internal dispatch method
-        used by generate().
+        Maps a BandNamePattern enum value to its assembler (see _ASSEMBLERS)
+        and calls it to produce a band name.
 
         Args:
             pattern: The BandNamePattern enum value specifying which pattern to use.
@@ -317,7 +374,7 @@ class BandNameGenerator:
 
         Raises:
             NotImplementedError: If the specified pattern has no corresponding
-                generator method (e.g., COMPOUND_WORD or SINGLE_WORD).
+                assembler (e.g., COMPOUND_WORD or SINGLE_WORD).
 
         Example:
             >>> generator = BandNameGenerator()
@@ -325,33 +382,15 @@ class BandNameGenerator:
             >>> isinstance(name, str)
             True
         """
-        # Map each pattern enum to its corresponding generator method
-        pattern_map = {
-            BandNamePattern.ADJECTIVE_NOUN: self.generate_adjective_noun,
-            BandNamePattern.COLOR_NOUN: self.generate_color_noun,
-            BandNamePattern.METAL_NOUN: self.generate_metal_noun,
-            BandNamePattern.VERB_NOUN: self.generate_verb_noun,
-            BandNamePattern.NOUN_NOUN: self.generate_noun_noun,
-            BandNamePattern.THE_ADJECTIVE_NOUN: self.generate_the_adjective_noun,
-            BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN: self.generate_adjective_adjective_noun,
-            BandNamePattern.ADJECTIVE_NOUN_PLURAL: self.generate_adjective_noun_plural,
-            BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN_PLURAL: (
-                self.generate_adjective_adjective_noun_plural
-            ),
-            BandNamePattern.COLOR_ADJECTIVE_NOUN_PLURAL: (
-                self.generate_color_adjective_noun_plural
-            ),
-        }
-
-        # Look up the generator function for this pattern
-        generator_func = pattern_map.get(pattern)
-        if generator_func is None:
+        # Look up the assembler for this pattern
+        assembler = _ASSEMBLERS.get(pattern)
+        if assembler is None:
             # Pattern exists but has no implementation yet
             msg = f"Pattern {pattern} not yet implemented"
             raise NotImplementedError(msg)
 
-        # Call the generator function and return the result
-        return generator_func()
+        # Build the name directly from the pre-capitalized word tables
+        return assembler(self.word_fetcher.rng.choice)
 
     def generate(self, pattern: BandNamePattern | None = None, count: int = 1) -> list[str]:
         """Generate one or more random band names.
@@ -369,6 +408,10 @@ class BandNameGenerator:
             List of generated band name strings. Each name is properly capitalized.
             Length of list equals the count parameter.
 
+        Raises:
+            NotImplementedError: If the specified pattern has no implementation
+                (e.g., COMPOUND_WORD or SINGLE_WORD).
+
         Example:
             >>> generator = BandNameGenerator()
             >>> names = generator.generate(count=3)
@@ -378,17 +421,79 @@ class BandNameGenerator:
             >>> len(names)
             2
         """
-        results = []
-        # Generate the requested number of names
-        for _ in range(count):
-            if pattern is None:
-                # No pattern specified: choose randomly from all multi-word patterns
-                chosen_pattern = random.choice(BandNamePattern.multi_word_patterns())
-            else:
-                # Use the specified pattern for all generated names
-                chosen_pattern = pattern
-
-            # Generate one name using the chosen pattern and add to results
-            results.append(self.generate_by_pattern(chosen_pattern))
-
-        return results
+        if pattern is not None and pattern not in _ASSEMBLERS:
+            # Pattern exists but has no implementation yet
+            msg = f"Pattern {pattern} not yet implemented"
+            raise NotImplementedError(msg)
+
+        # Large batches are assembled with NumPy when it is already imported
+        # (never imported here: that costs more than it saves below ~75k
+        # names), unless every draw must come from the OS (SystemRandom) or
+        # the output must not depend on the environment (seeded)
+        rng = self.word_fetcher.rng
+        if (
+            count >= NUMPY_MIN_COUNT
+            and "numpy" in sys.modules
+            and not self.word_fetcher.seeded
+            and not isinstance(rng, random.SystemRandom)
+        ):
+            return self._generate_bulk(pattern, count)
+
+        choice = rng.choice
+        if pattern is None:
+            # No pattern specified: draw every name's pattern as a plain index
+            # in a single call, avoiding enum hashing and dict lookups per name
+            indices = rng.choices(_ASSEMBLER_INDICES, k=count)
+            return [_ASSEMBLER_TUPLE[i](choice) for i in indices]
+
+        # Use the specified pattern's assembler for all generated names
+        assembler = _ASSEMBLERS[pattern]
+        return [assembler(choice) for _ in range(count)]
+
+    def _generate_bulk(self, pattern: BandNamePattern | None, count: int) -> list[str]:
+        """Generate many band names at once using NumPy.
+
+        Draws all pattern and word indices as integer arrays, then builds the
+        names of each pattern with element-wise string concatenation on
+        object arrays, so the only per-name work happens inside NumPy loops.
+        The NumPy generator is seeded from word_fetcher.rng but draws different
+        names than the pure-Python path, so generate() never uses this one
+        for seeded generators.
+
+        Args:
+            pattern: Pattern to use for every name, or None to pick randomly
+                from the multi-word patterns for each name.
+            count: Number of band names to generate.
+
+        Returns:
+            List of generated band name strings.
+        """
+        import numpy as np
+
+        rng = np.random.default_rng(self.word_fetcher.rng.getrandbits(64))
+        arrays = _word_arrays()
+
+        # Group name positions by pattern
+        if pattern is None:
+            choices = BandNamePattern.multi_word_patterns()
+            pattern_idx = rng.integers(0, len(choices), size=count)
+            groups = [(p, np.flatnonzero(pattern_idx == i)) for i, p in enumerate(choices)]
+        else:
+            groups = [(pattern, np.arange(count))]
+
+        names = np.empty(count, dtype=object)
+        for p, positions in groups:
+            if not len(positions):
+                continue
+            # Interleave the template's literal text with one word array per slot
+            template, slots = _RECIPES[p]
+            literals = template.split("{}")
+            group = np.full(len(positions), literals[0], dtype=object)
+            for slot, literal in zip(slots, literals[1:], strict=True):
+                words = arrays[slot]
+                group = group + words[rng.integers(0, len(words), size=len(positions))]
+                if literal:
+                    group = group + literal
+            names[positions] = group
+        result: list[str] = names.tolist()
+        return result
@@ -47,7 +47,7 @@ class BandNamePattern(Enum):
         'metal_noun'
         >>> patterns = BandNamePattern.two_word_patterns()
         >>> len(patterns)
-        5
+        6
     """
 
     # Two-word patterns
@@ -73,15 +73,16 @@ class BandNamePattern(Enum):
     SINGLE_WORD = "single_word"  # Metallica, Radiohead
 
     @classmethod
-    def multi_word_patterns(cls) -> list[BandNamePattern]:
+    def multi_word_patterns(cls) -> tuple[BandNamePattern, ...]:
         """Get all patterns that generate multi-word band names.
 
         Returns all currently implemented patterns that produce band names
         with multiple words. This excludes COMPOUND_WORD and SINGLE_WORD
-        which are not yet implemented.
+        which are not yet implemented. The same module-level tuple is
+        returned on every call.
 
         Returns:
-            List of BandNamePattern enum values for multi-word patterns.
+            Tuple of BandNamePattern enum values for multi-word patterns.
             Currently returns 10 patterns (6 two-word + 4 multi-word).
 
         Example:
@@ -91,28 +92,18 @@ class BandNamePattern(Enum):
             >>> BandNamePattern.METAL_NOUN in patterns
             True
         """
-        return [
-            cls.ADJECTIVE_NOUN,
-            cls.COLOR_NOUN,
-            cls.METAL_NOUN,
-            cls.VERB_NOUN,
-            cls.NOUN_NOUN,
-            cls.THE_ADJECTIVE_NOUN,
-            cls.ADJECTIVE_ADJECTIVE_NOUN,
-            cls.ADJECTIVE_NOUN_PLURAL,
-            cls.ADJECTIVE_ADJECTIVE_NOUN_PLURAL,
-            cls.COLOR_ADJECTIVE_NOUN_PLURAL,
-        ]
+        return MULTI_WORD_PATTERNS
 
     @classmethod
-    def two_word_patterns(cls) -> list[BandNamePattern]:
+    def two_word_patterns(cls) -> tuple[BandNamePattern, ...]:
         """Get patterns that generate exactly two-word band names.
 
         Returns only the patterns that produce names with exactly two words.
-        This is a subset of multi_word_patterns().
+        This is a subset of multi_word_patterns(). The same module-level
+        tuple is returned on every call.
 
         Returns:
-            List of BandNamePattern enum values for two-word patterns.
+            Tuple of BandNamePattern enum values for two-word patterns.
             Currently returns 6 patterns.
 
         Example:
@@ -124,11 +115,28 @@ class BandNamePattern(Enum):
             >>> BandNamePattern.THE_ADJECTIVE_NOUN in patterns
             False
         """
-        return [
-            cls.ADJECTIVE_NOUN,
-            cls.COLOR_NOUN,
-            cls.METAL_NOUN,
-            cls.VERB_NOUN,
-            cls.NOUN_NOUN,
-            cls.ADJECTIVE_NOUN_PLURAL,
-        ]
+        return TWO_WORD_PATTERNS
+
+
+# Pattern groups, built once at import and returned by the classmethods above
+MULTI_WORD_PATTERNS: tuple[BandNamePattern, ...] = (
+    BandNamePattern.ADJECTIVE_NOUN,
+    BandNamePattern.COLOR_NOUN,
+    BandNamePattern.METAL_NOUN,
+    BandNamePattern.VERB_NOUN,
+    BandNamePattern.NOUN_NOUN,
+    BandNamePattern.THE_ADJECTIVE_NOUN,
+    BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN,
+    BandNamePattern.ADJECTIVE_NOUN_PLURAL,
+    BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN_PLURAL,
+    BandNamePattern.COLOR_ADJECTIVE_NOUN_PLURAL,
+)
+
+TWO_WORD_PATTERNS: tuple[BandNamePattern, ...] = (
+    BandNamePattern.ADJECTIVE_NOUN,
+    BandNamePattern.COLOR_NOUN,
+    BandNamePattern.METAL_NOUN,
+    BandNamePattern.VERB_NOUN,
+    BandNamePattern.NOUN_NOUN,
+    BandNamePattern.ADJECTIVE_NOUN_PLURAL,
+)
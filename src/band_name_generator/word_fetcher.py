@@ -1,19 +1,78 @@
 """Utilities for fetching random words from various sources."""
 
+import functools
+import importlib.util
+import json
+import math
+import os
 import random
+import re
 import sys
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 
-try:
+if TYPE_CHECKING:
+    import numpy as np
     import requests
 
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+# requests (and urllib3, certifi, ...) is only imported when the remote word
+# list is actually fetched; here we just check that it is installed. Without
+# it, or if it fails to import then, the word list is fetched with
+# urllib.request instead.
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
 
 
+# Smallest batch that uses NumPy: names in BandNameGenerator.generate(), words
+# in get_words(). The vectorized paths are 4-6x faster per item, but importing
+# NumPy costs 50-70ms, more than it saves on batches below ~75k names, so
+# neither path ever imports it: both use NumPy only once the caller has.
+NUMPY_MIN_COUNT = 10_000
+
 # Word list sources
 WORD_LIST_URL = "https://www.mit.edu/~ecprice/wordlist.10000"
 
+# Matches lines of 4-12 ASCII letters in the (lowercased) raw word list body
+_WORD_FILTER_RE = re.compile(rb"(?m)^([a-z]{4,12})\r?$")
+
+# (connect, read) timeouts in seconds for the word list request
+WORD_LIST_TIMEOUT = (3.05, 5)
+
+# Shared HTTP session, created on first use by _get_session()
+_SESSION: requests.Session | None = None
+
+
+def _default_cache_path() -> Path | None:
+    """
+    Return where the filtered remote word list is cached on disk.
+
+    Follows the XDG Base Directory spec: $XDG_CACHE_HOME when it is set to an
+    absolute path, ~/.cache otherwise.
+
+    Returns:
+        Path of the cached word list file, or None if there is no home
+        directory to put it in (e.g. HOME unset and no passwd entry).
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME", "")
+    if os.path.isabs(xdg_cache):
+        cache_home = Path(xdg_cache)
+    else:
+        try:
+            cache_home = Path.home() / ".cache"
+        except RuntimeError:
+            return None
+    return cache_home / "band_name_generator" / "wordlist.txt"
+
+
+# On-disk cache for the filtered remote word list. None means the default
+# location from _default_cache_path(), resolved only when the cache is used
+# so importing this module never depends on a home directory.
+WORD_LIST_CACHE: Path | None = None
+WORD_LIST_CACHE_TTL = 86400  # seconds (1 day)
+
 # Fallback word lists by category
 ADJECTIVES = [
     "broken",
@@ -78,9 +137,7 @@ ADJECTIVES = [
     "dapper",
     "trashy",
     "mighty",
-    "stormy",
     "rude",
-    "somber",
     "classy",
     "used",
     "noxious",
@@ -93,8 +150,6 @@ ADJECTIVES = [
     "odd",
     "lying",
     "rough",
-    "nervous",
-    "dizzy",
     "violent",
     "overt",
     "upbeat",
@@ -112,13 +167,11 @@ ADJECTIVES = [
     "woozy",
     "bad",
     "slim",
-    "rabid",
     "irate",
     "happy",
     "shy",
     "true",
     "festive",
-    "irate",
 ]
 
 NOUNS = [
@@ -214,7 +267,6 @@ COLORS = [
     "azure",
     "emerald",
     "amber",
-    "violet",
     "indigo",
     "rainbow",
     "tan",
@@ -274,6 +326,344 @@ VERBS = [
 ]
 
 
+def _pluralize_rules(word: str) -> str:
+    """
+    Simple pluralization (not perfect, but good enough).
+
+    Handles common pluralization rules:
+    - Words ending in s, x, z, ch, sh → add "es"
+    - Words ending in consonant + y → change y to "ies"
+    - All other words → add "s"
+
+    Args:
+        word: The word to pluralize.
+
+    Returns:
+        Pluralized form of the word.
+
+    Examples:
+        >>> _pluralize_rules("storm")
+        'storms'
+        >>> _pluralize_rules("city")
+        'cities'
+    """
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        # Words ending in sibilants need "es"
+        return word + "es"
+    elif word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
+        # Consonant + y → ies
+        return word[:-1] + "ies"
+    else:
+        # Default: add "s"
+        return word + "s"
+
+
+# Plural forms of the built-in nouns, computed once at import
+_PLURAL_CACHE: dict[str, str] = {noun: _pluralize_rules(noun) for noun in NOUNS}
+NOUNS_PLURAL: tuple[str, ...] = tuple(_PLURAL_CACHE[noun] for noun in NOUNS)
+
+
+def pluralize(word: str) -> str:
+    """
+    Pluralize a word, using the precomputed forms for built-in nouns.
+
+    Built-in nouns are a single dict lookup; any other word falls back
+    to the suffix rules in _pluralize_rules().
+
+    Args:
+        word: The word to pluralize.
+
+    Returns:
+        Pluralized form of the word.
+
+    Examples:
+        >>> pluralize("storm")
+        'storms'
+        >>> pluralize("box")
+        'boxes'
+    """
+    plural = _PLURAL_CACHE.get(word)
+    return plural if plural is not None else _pluralize_rules(word)
+
+
+# Combined pool used by get_words() when the remote list is unavailable
+_FALLBACK_WORDS: tuple[str, ...] = (*ADJECTIVES, *NOUNS, *VERBS)
+
+# Capitalized copies of the category lists, built once at import so band
+# names can be assembled without capitalizing words on every call
+ADJECTIVES_CAP: tuple[str, ...] = tuple(word.capitalize() for word in ADJECTIVES)
+NOUNS_CAP: tuple[str, ...] = tuple(word.capitalize() for word in NOUNS)
+COLORS_CAP: tuple[str, ...] = tuple(word.capitalize() for word in COLORS)
+METALS_CAP: tuple[str, ...] = tuple(word.capitalize() for word in METALS)
+VERBS_CAP: tuple[str, ...] = tuple(word.capitalize() for word in VERBS)
+NOUNS_PLURAL_CAP: tuple[str, ...] = tuple(word.capitalize() for word in NOUNS_PLURAL)
+
+# Built-in word lists by category name, used by WordFetcher.sample() (public
+# API for bulk draws by category). The generator's pattern recipes name their
+# slots with the same keys and draw from CATEGORIES_CAP.
+CATEGORIES: dict[str, Sequence[str]] = {
+    "adjective": ADJECTIVES,
+    "noun": NOUNS,
+    "noun_plural": NOUNS_PLURAL,
+    "verb": VERBS,
+    "color": COLORS,
+    "metal": METALS,
+}
+CATEGORIES_CAP: dict[str, Sequence[str]] = {
+    "adjective": ADJECTIVES_CAP,
+    "noun": NOUNS_CAP,
+    "noun_plural": NOUNS_PLURAL_CAP,
+    "verb": VERBS_CAP,
+    "color": COLORS_CAP,
+    "metal": METALS_CAP,
+}
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the shared HTTP session, importing requests on first use.
+
+    The session keeps the connection alive between fetches and retries
+    transient failures (connection errors, 502/503/504) with backoff.
+
+    Returns:
+        The module-wide requests.Session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=1,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+            ),
+        )
+    return _SESSION
+
+
+def _http_get(url: str, headers: dict[str, str]) -> tuple[int, bytes, dict[str, str]]:
+    """
+    Perform a GET request with requests if it imports, or urllib otherwise.
+
+    The requests path goes through the shared session (keep-alive, retries).
+    The urllib path asks for a gzip-compressed body and decompresses it.
+    A 304 Not Modified reply is returned, not raised, on both paths.
+
+    Args:
+        url: URL to fetch.
+        headers: Extra request headers (e.g., conditional request headers).
+
+    Returns:
+        Tuple of (status code, response body, response headers with
+        lowercased names).
+
+    Raises:
+        OSError: On connection errors, timeouts and HTTP error statuses
+            (requests.RequestException and urllib.error.URLError are both
+            OSError subclasses). Bad gzip data and malformed responses on the
+            urllib path are re-raised as OSError as well.
+    """
+    global REQUESTS_AVAILABLE
+    if REQUESTS_AVAILABLE:
+        try:
+            session = _get_session()
+        except ImportError:
+            # Installed but not importable (e.g. urllib3 v2 on an old OpenSSL):
+            # use urllib instead, now and for every later fetch
+            REQUESTS_AVAILABLE = False
+        else:
+            response = session.get(url, timeout=WORD_LIST_TIMEOUT, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()  # Raise exception for bad status codes
+            response_headers = {name.lower(): value for name, value in response.headers.items()}
+            return response.status_code, response.content, response_headers
+
+    import gzip
+    import http.client
+    import urllib.error
+    import urllib.request
+    import zlib
+
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip", **headers})
+    try:
+        # urlopen() takes a single timeout; use the (longer) read timeout
+        with urllib.request.urlopen(request, timeout=WORD_LIST_TIMEOUT[1]) as response:
+            content = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                content = gzip.decompress(content)
+            response_headers = {name.lower(): value for name, value in response.headers.items()}
+            return response.status, content, response_headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, b"", {}
+        raise
+    except (EOFError, zlib.error, http.client.HTTPException) as e:
+        # Truncated or corrupt gzip data and malformed HTTP responses are
+        # network failures too; report them like every other one
+        msg = f"Invalid response from {url}: {type(e).__name__}: {e}"
+        raise OSError(msg) from e
+
+
+def _load_cached_wordlist(path: Path, ttl: float = WORD_LIST_CACHE_TTL) -> list[str] | None:
+    """
+    Load a previously cached (already filtered) word list from disk.
+
+    Args:
+        path: Location of the cache file.
+        ttl: Maximum age of the cache file in seconds.
+
+    Returns:
+        List of cached words, or None if the cache is missing, stale, or unreadable.
+    """
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        words = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    return words or None
+
+
+def _write_atomically(path: Path, text: str) -> None:
+    """
+    Replace path with text via a temporary file unique to this call.
+
+    The temporary file lives in the same directory, so os.replace() is an
+    atomic rename; concurrent writers (e.g. parallel CLI runs refreshing the
+    cache) each use their own file and can never move another's half-written
+    one into place.
+
+    Args:
+        path: File to replace.
+        text: New contents, written as UTF-8.
+
+    Raises:
+        OSError: If the file cannot be written; the temporary file is removed.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _store_cached_wordlist(
+    path: Path, words: list[str], validators: dict[str, str] | None = None
+) -> None:
+    """
+    Atomically write a filtered word list to the disk cache.
+
+    Each file is written to its own temporary file first and then moved into
+    place (see _write_atomically()), so concurrent readers never see a partial
+    file, even while other processes are storing the list too.
+    Failures are ignored since the cache is only an optimization.
+
+    Args:
+        path: Location of the cache file.
+        words: Filtered words to store, one per line.
+        validators: Conditional request headers (If-None-Match and/or
+            If-Modified-Since) to revalidate this copy with later. Stored
+            next to the cache file; see _load_cached_validators().
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomically(path, "\n".join(words) + "\n")
+        meta = _validators_path(path)
+        if validators:
+            _write_atomically(meta, json.dumps(validators))
+        else:
+            meta.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _validators_path(path: Path) -> Path:
+    """Return where the conditional request headers for a cache file are kept."""
+    return path.with_name(path.name + ".validators.json")
+
+
+def _load_cached_validators(path: Path) -> dict[str, str]:
+    """
+    Load the conditional request headers stored with a cached word list.
+
+    Args:
+        path: Location of the cache file.
+
+    Returns:
+        Headers to send when revalidating the cache, or an empty dict if none
+        were stored or the file is unreadable.
+    """
+    try:
+        text = _validators_path(path).read_text(encoding="utf-8")
+    except OSError:
+        return {}
+    try:
+        validators = json.loads(text)
+    except ValueError:
+        return {}
+    if not isinstance(validators, dict):
+        return {}
+    return {str(k): str(v) for k, v in validators.items()}
+
+
+@functools.lru_cache(maxsize=4)
+def _word_array(words: tuple[str, ...]) -> np.ndarray[Any, Any]:
+    """Return words as a NumPy object array, reused across calls with the same pool."""
+    import numpy as np
+
+    return np.array(words, dtype=object)
+
+
+def _sample_words(
+    rng: random.Random, words: Sequence[str], k: int, vectorize: bool = True
+) -> list[str]:
+    """
+    Draw k words from a pool with replacement.
+
+    Uses a single rng.choices() call, or a NumPy index gather for large k
+    when NumPy is already imported. The two paths draw different words from
+    the same rng state, so callers that need a reproducible sequence pass
+    vectorize=False.
+
+    Args:
+        rng: Random number generator to draw with.
+        words: Pool of words to sample from.
+        k: Number of words to draw.
+        vectorize: If False, never use NumPy.
+
+    Returns:
+        List of k randomly chosen words.
+    """
+    # SystemRandom callers asked for OS randomness on every draw, which a
+    # NumPy generator seeded once from it would not give them
+    if (
+        k < NUMPY_MIN_COUNT
+        or not vectorize
+        or "numpy" not in sys.modules
+        or isinstance(rng, random.SystemRandom)
+    ):
+        return rng.choices(words, k=k)
+
+    import numpy as np
+
+    pool = _word_array(tuple(words))
+    np_rng = np.random.default_rng(rng.getrandbits(64))
+    sampled: list[str] = pool[np_rng.integers(0, len(pool), size=k)].tolist()
+    return sampled
+
+
 class WordFetcher:
     """
     Fetches random words from various sources.
@@ -284,21 +674,66 @@ class WordFetcher:
 
     Attributes:
         _cached_words: Optional cache of words fetched from online source.
-                      Initialized as None and populated on first use.
+                      Shared by all instances: None until the first
+                      get_words() call of any instance fills it with an
+                      immutable, already-filtered tuple.
+        _cache_lock: Guards filling _cached_words so concurrent first calls
+                     fetch the word list only once.
         verbose: If True, prints debug information about word fetching.
+        rng: This instance's random.Random (or random.SystemRandom when
+            fast_mode=False), used for every word drawn. Independent of the
+            global random module state.
+        seeded: True if rng was created from an explicit seed. Seeded
+            fetchers never take the NumPy paths, so their draws do not
+            depend on whether NumPy is installed or imported.
     """
 
-    def __init__(self, verbose: bool = False) -> None:
+    # The word cache and its lock are class attributes, so only the verbose
+    # flag and random number generator (and whether it is seeded) are stored
+    # per instance
+    __slots__ = ("rng", "seeded", "verbose")
+
+    _cached_words: ClassVar[tuple[str, ...] | None] = None
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        seed: int | None = None,
+        prefetch: bool = False,
+        fast_mode: bool = True,
+    ) -> None:
         """
         Initialize the word fetcher.
 
-        Sets up an empty cache for words fetched from online sources.
-        The cache will be populated lazily on first use if use_cache=True.
+        The word cache lives on the class, so new instances reuse words
+        already fetched by earlier ones; it is populated lazily on first use
+        if use_cache=True.
 
         Args:
             verbose: If True, prints debug information about word fetching.
+            seed: Optional seed for this fetcher's random number generator,
+                for word sequences that are reproducible in any environment.
+                None seeds from the OS.
+            prefetch: If True and the word cache is still empty, start filling
+                it in a background thread now, so the first get_words() call
+                does not wait for the whole download.
+            fast_mode: If True (default), draw with the Mersenne Twister
+                random.Random. If False, draw every word from the OS
+                randomness source via random.SystemRandom, which is an order
+                of magnitude slower and cannot be seeded.
+
+        Raises:
+            ValueError: If a seed is given with fast_mode=False.
         """
-        self._cached_words: list[str] | None = None
+        if fast_mode:
+            self.rng = random.Random(seed)
+        elif seed is not None:
+            msg = "seed cannot be used with fast_mode=False (SystemRandom is not seedable)"
+            raise ValueError(msg)
+        else:
+            self.rng = random.SystemRandom()
+        self.seeded = seed is not None
         self.verbose = verbose
 
         if self.verbose:
@@ -318,45 +753,97 @@ class WordFetcher:
                 file=sys.stderr,
             )
 
-    def _fetch_word_list(self) -> list[str]:
+        # Fill the shared word cache in the background; get_words() blocks on
+        # _cache_lock until the download finishes
+        if prefetch and WordFetcher._cached_words is None:
+            threading.Thread(target=self._prime_cache, daemon=True).start()
+
+    def _prime_cache(self) -> None:
+        """
+        Fill the shared word cache unless another call already has.
+
+        The check is repeated under _cache_lock, so concurrent callers (including
+        a prefetch thread) fetch the word list only once; the others block
+        until it is ready.
+        """
+        with WordFetcher._cache_lock:
+            if WordFetcher._cached_words is None:
+                if self.verbose:
+                    print("[DEBUG] Initializing word cache...", file=sys.stderr)
+                WordFetcher._cached_words = tuple(self._fetch_word_list())
+
+    def _fetch_word_list(self, refresh: bool = False) -> list[str]:
         """
         Fetch word list from online source.
 
         Attempts to download a word list from MIT's public word list URL.
         Filters words to only include those between 4-12 characters that
-        contain only alphabetic characters.
+        contain only alphabetic characters. The filtered list is cached on
+        disk (see WORD_LIST_CACHE) so later runs skip the HTTP round trip;
+        without a usable cache location every run downloads it.
+
+        Args:
+            refresh: If True, ignore the disk cache and always download.
 
         Returns:
             List of filtered words in lowercase, or empty list if fetch fails.
 
         Note:
-            Requires the 'requests' library to be available. Returns empty
-            list if requests is not installed or if any network error occurs.
+            Uses the 'requests' library when it is installed and the standard
+            library's urllib otherwise. If a network error occurs, returns the
+            expired disk cache when there is one, or an empty list otherwise.
+
+            An expired cache is revalidated with a conditional request
+            (If-None-Match / If-Modified-Since); a 304 Not Modified reply
+            renews it without downloading the list again.
         """
-        # Check if requests library is available
-        if not REQUESTS_AVAILABLE:
-            if self.verbose:
-                print(
-                    "[DEBUG] requests library not available, using fallback words",
-                    file=sys.stderr,
-                )
-            return []
+        # Serve from the disk cache when it is fresh; otherwise keep any
+        # expired copy to revalidate or to fall back on if the fetch fails
+        cache = WORD_LIST_CACHE or _default_cache_path()
+        stale: list[str] | None = None
+        if cache is not None and not refresh:
+            cached = _load_cached_wordlist(cache)
+            if cached is not None:
+                if self.verbose:
+                    print(
+                        f"[DEBUG] Loaded {len(cached)} words from cache {cache}",
+                        file=sys.stderr,
+                    )
+                return cached
+            stale = _load_cached_wordlist(cache, ttl=math.inf)
 
         try:
             if self.verbose:
                 print(f"[DEBUG] Fetching word list from {WORD_LIST_URL}...", file=sys.stderr)
 
-            # Fetch word list from MIT with 5 second timeout
-            response = requests.get(WORD_LIST_URL, timeout=5)
-            response.raise_for_status()  # Raise exception for bad status codes
+            # Fetch word list from MIT, conditionally if we hold an expired copy
+            headers = _load_cached_validators(cache) if cache is not None and stale else {}
+            status, content, response_headers = _http_get(WORD_LIST_URL, headers)
+            if cache is not None and stale and status == 304:
+                # Unchanged on the server: renew the cache's age and reuse it
+                try:
+                    os.utime(cache)
+                except OSError:
+                    pass
+                if self.verbose:
+                    print("[DEBUG] Remote word list not modified, reusing cache", file=sys.stderr)
+                return stale
 
-            # Decode response and split into individual words
-            words = response.content.decode("utf-8").splitlines()
-
-            # Filter words: 4-12 characters, alphabetic only, convert to lowercase
+            # Filter words: 4-12 characters, alphabetic only, lowercase. The
+            # regex scans the raw bytes in one pass; only survivors are decoded.
             filtered_words = [
-                word.lower() for word in words if 4 <= len(word.strip()) <= 12 and word.isalpha()
+                word.decode("ascii") for word in _WORD_FILTER_RE.findall(content.lower())
             ]
+            if cache is not None and filtered_words:
+                validators = {
+                    request_header: response_headers[response_header]
+                    for request_header, response_header in (
+                        ("If-None-Match", "etag"),
+                        ("If-Modified-Since", "last-modified"),
+                    )
+                    if response_header in response_headers
+                }
+                _store_cached_wordlist(cache, filtered_words, validators)
 
             if self.verbose:
                 print(
@@ -364,16 +851,24 @@ class WordFetcher:
                     file=sys.stderr,
                 )
 
-            return filtered_words
-        except Exception as e:
-            # Return empty list on any error (network, timeout, decode, etc.)
+            # A body with no usable words (changed format, captive portal
+            # page) is no better than a failed fetch: keep the expired copy
+            return filtered_words or stale or []
+        except OSError as e:
+            # On network errors (connection, timeout, HTTP status, exhausted
+            # retries, bad gzip data; requests' exceptions are OSErrors too)
+            # fall back to the expired cache, or an empty list; anything else
+            # is a bug and should propagate
             if self.verbose:
                 print(
                     f"[DEBUG] Failed to fetch remote word list: {type(e).__name__}: {e}",
                     file=sys.stderr,
                 )
-                print("[DEBUG] Will use fallback word lists", file=sys.stderr)
-            return []
+                if stale:
+                    print("[DEBUG] Will use the expired cached word list", file=sys.stderr)
+                else:
+                    print("[DEBUG] Will use fallback word lists", file=sys.stderr)
+            return stale or []
 
     def get_words(self, count: int = 1, use_cache: bool = True) -> list[str]:
         """
@@ -396,14 +891,15 @@ class WordFetcher:
             >>> len(words)
             3
         """
-        # Populate cache on first use if caching is enabled
-        if use_cache and self._cached_words is None:
-            if self.verbose:
-                print("[DEBUG] Initializing word cache...", file=sys.stderr)
-            self._cached_words = self._fetch_word_list()
+        # Populate the shared cache on first use if caching is enabled (this
+        # waits for a prefetch that is still in flight)
+        if use_cache and WordFetcher._cached_words is None:
+            self._prime_cache()
 
         # Use cached words or fetch fresh ones based on use_cache flag
-        word_source = self._cached_words if use_cache else self._fetch_word_list()
+        word_source: Sequence[str] | None = (
+            WordFetcher._cached_words if use_cache else self._fetch_word_list(refresh=True)
+        )
 
         # If we successfully got words from online source, use them
         if word_source:
@@ -411,17 +907,16 @@ class WordFetcher:
                 print("[DEBUG] Using cached remote words", file=sys.stderr)
             elif self.verbose:
                 print("[DEBUG] Using fresh remote words", file=sys.stderr)
-            return [random.choice(word_source) for _ in range(count)]
+            return _sample_words(self.rng, word_source, count, vectorize=not self.seeded)
 
-        # Fallback: combine all built-in word lists and select randomly
+        # Fallback: select randomly from the combined built-in word lists
         if self.verbose:
             print(
                 f"[DEBUG] Using fallback word lists ({len(ADJECTIVES)} adjectives, "
                 f"{len(NOUNS)} nouns, {len(VERBS)} verbs)",
                 file=sys.stderr,
             )
-        all_words = ADJECTIVES + NOUNS + VERBS
-        return [random.choice(all_words) for _ in range(count)]
+        return _sample_words(self.rng, _FALLBACK_WORDS, count, vectorize=not self.seeded)
 
     def get_adjective(self) -> str:
         """
@@ -430,7 +925,7 @@ class WordFetcher:
         Returns:
             A random adjective from the ADJECTIVES list (e.g., "dark", "electric").
         """
-        return random.choice(ADJECTIVES)
+        return self.rng.choice(ADJECTIVES)
 
     def get_noun(self) -> str:
         """
@@ -439,7 +934,16 @@ class WordFetcher:
         Returns:
             A random noun from the NOUNS list (e.g., "storm", "mountain").
         """
-        return random.choice(NOUNS)
+        return self.rng.choice(NOUNS)
+
+    def get_noun_plural(self) -> str:
+        """
+        Get a random noun in plural form.
+
+        Returns:
+            A random plural noun from the NOUNS_PLURAL list (e.g., "storms", "cities").
+        """
+        return self.rng.choice(NOUNS_PLURAL)
 
     def get_verb(self) -> str:
         """
@@ -452,7 +956,7 @@ class WordFetcher:
             Most verbs in the list are present participles (ending in -ing)
             suitable for band name patterns like "Burning Sky".
         """
-        return random.choice(VERBS)
+        return self.rng.choice(VERBS)
 
     def get_color(self) -> str:
         """
@@ -461,7 +965,7 @@ class WordFetcher:
         Returns:
             A random color from the COLORS list (e.g., "red", "crimson").
         """
-        return random.choice(COLORS)
+        return self.rng.choice(COLORS)
 
     def get_metal(self) -> str:
         """
@@ -473,4 +977,71 @@ class WordFetcher:
         Note:
             Used for band names like "Iron Maiden" or "Steel Panther".
         """
-        return random.choice(METALS)
+        return self.rng.choice(METALS)
+
+    def sample(self, category: str, k: int, capitalized: bool = False) -> list[str]:
+        """
+        Get k random words from a category in a single call.
+
+        Draws with replacement, exactly like k calls to the matching
+        get_* method, but in one rng.choices() call. BandNameGenerator does
+        not use it (its assemblers draw from CATEGORIES_CAP directly); it is
+        part of the public API for callers that want bulk draws by category.
+
+        Args:
+            category: Category name, one of the keys of CATEGORIES
+                      ("adjective", "noun", "noun_plural", "verb", "color",
+                      "metal").
+            k: Number of words to draw.
+            capitalized: If True, draw from the pre-capitalized copies
+                         of the lists (e.g., "Iron" instead of "iron").
+
+        Returns:
+            List of k random words from the category.
+
+        Raises:
+            ValueError: If the category is unknown.
+
+        Example:
+            >>> fetcher = WordFetcher()
+            >>> len(fetcher.sample("noun", 3))
+            3
+        """
+        words = (CATEGORIES_CAP if capitalized else CATEGORIES).get(category)
+        if words is None:
+            msg = f"Unknown word category: {category!r}"
+            raise ValueError(msg)
+        return self.rng.choices(words, k=k)
+
+
+def get_fetcher(verbose: bool = False) -> WordFetcher:
+    """
+    Return the process-wide unseeded WordFetcher for a verbosity setting.
+
+    The word cache is already shared by all instances; this also shares the
+    instance itself, so callers that do not need their own seed skip
+    constructing (and seeding) a new fetcher. Because of that sharing:
+
+    - all callers (including every unseeded BandNameGenerator) draw from the
+      same rng, so their word sequences are interleaved, not independent;
+    - the verbose initialization output is printed only once per process,
+      when the verbose fetcher is first created.
+
+    Args:
+        verbose: If True, the fetcher prints debug information.
+
+    Returns:
+        Shared WordFetcher instance.
+
+    Example:
+        >>> get_fetcher() is get_fetcher(verbose=False)
+        True
+    """
+    # Normalize the argument so every spelling of a call shares one instance
+    return _get_fetcher(bool(verbose))
+
+
+@functools.cache
+def _get_fetcher(verbose: bool) -> WordFetcher:
+    """Create the shared fetcher for get_fetcher(); always called positionally."""
+    return WordFetcher(verbose=verbose)
@@ -0,0 +1,52 @@
+"""Tests for command-line argument parsing and random mode."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from band_name_generator import cli
+from band_name_generator.cli import _build_parser, _parse_args
+
+
+def test_parse_args_matches_argparse() -> None:
+    """Test the fast parser produces the same values as argparse."""
+    for argv in (
+        [],
+        ["-l"],
+        ["-n", "3", "-p", "metal_noun"],
+        ["--count=3", "--pattern=color_noun", "-v"],
+        ["-r", "-i", "0.5", "-n", "2"],
+    ):
+        fast = _parse_args(argv)
+        assert fast is not None
+        assert vars(fast) == vars(_build_parser().parse_args(argv))
+
+
+def test_parse_args_defers_to_argparse() -> None:
+    """Test unusual or invalid command lines are left to argparse."""
+    for argv in (["-h"], ["-x"], ["-n"], ["-n", "x"], ["-n", "-1"], ["--coun", "2"], ["-l=1"]):
+        assert _parse_args(argv) is None
+
+
+def test_random_mode_resumes_pacing_after_stall(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test random mode does not burst out missed names after a stall."""
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    def fake_generate(pattern: object = None, count: int = 1) -> list[str]:
+        # The first batch stalls for far longer than the interval
+        if not sleeps:
+            now[0] += 10.0
+        return ["Name"] * count
+
+    monkeypatch.setattr(cli.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cli.time, "sleep", fake_sleep)
+    monkeypatch.setattr(cli.signal, "signal", lambda *args: None)
+    generator = SimpleNamespace(generate=fake_generate)
+
+    assert cli.run_random_mode(generator, None, 4, 1.0) == 0  # type: ignore[arg-type]
+    assert sleeps == [0.0, 1.0, 1.0]
@@ -1,7 +1,14 @@
 """Tests for band name generator."""
 
+import random
+import sys
+
+import pytest
+
+from band_name_generator import generator as generator_module
 from band_name_generator.generator import BandNameGenerator
 from band_name_generator.patterns import BandNamePattern
+from band_name_generator.word_fetcher import get_fetcher
 
 
 def test_generator_initialization() -> None:
@@ -132,6 +139,105 @@ def test_generate_with_pattern() -> None:
     assert all(isinstance(name, str) for name in names)
 
 
+def test_generate_all_patterns() -> None:
+    """Test bulk generation produces the right word count for every pattern."""
+    generator = BandNameGenerator()
+    word_counts = {
+        BandNamePattern.THE_ADJECTIVE_NOUN: 3,
+        BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN: 3,
+        BandNamePattern.ADJECTIVE_ADJECTIVE_NOUN_PLURAL: 4,
+        BandNamePattern.COLOR_ADJECTIVE_NOUN_PLURAL: 4,
+    }
+    for pattern in BandNamePattern.multi_word_patterns():
+        names = generator.generate(pattern=pattern, count=20)
+        assert len(names) == 20
+        for name in names:
+            words = name.split()
+            assert len(words) == word_counts.get(pattern, 2)
+            assert all(word[0].isupper() for word in words)
+
+
+def test_generate_unimplemented_pattern() -> None:
+    """Test generating with a pattern that has no implementation."""
+    generator = BandNameGenerator()
+    with pytest.raises(NotImplementedError):
+        generator.generate(pattern=BandNamePattern.SINGLE_WORD, count=2)
+
+
+def test_unseeded_generators_share_fetcher() -> None:
+    """Test unseeded generators use the process-wide fetcher from get_fetcher()."""
+    assert BandNameGenerator().word_fetcher is get_fetcher()
+    assert BandNameGenerator(verbose=True).word_fetcher is get_fetcher(verbose=True)
+    assert BandNameGenerator(seed=1).word_fetcher is not get_fetcher()
+
+
+def test_generate_seeded() -> None:
+    """Test generators with the same seed produce the same names."""
+    names = BandNameGenerator(seed=42).generate(count=20)
+    assert BandNameGenerator(seed=42).generate(count=20) == names
+    assert BandNameGenerator(seed=43).generate(count=20) != names
+
+
+def test_generate_seeded_skips_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test seeded generators give the same names whether or not NumPy is loaded."""
+    pytest.importorskip("numpy")
+    # generate() reads the threshold imported from word_fetcher
+    monkeypatch.setattr(generator_module, "NUMPY_MIN_COUNT", 10)
+    names = BandNameGenerator(seed=42).generate(count=20)
+    monkeypatch.delitem(sys.modules, "numpy")
+    assert BandNameGenerator(seed=42).generate(count=20) == names
+
+
+def test_generate_system_random(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test fast_mode=False draws from SystemRandom and skips the NumPy path."""
+    # generate() reads the threshold imported from word_fetcher
+    monkeypatch.setattr(generator_module, "NUMPY_MIN_COUNT", 10)
+    monkeypatch.setattr(BandNameGenerator, "_generate_bulk", None)
+    generator = BandNameGenerator(fast_mode=False)
+    assert isinstance(generator.word_fetcher.rng, random.SystemRandom)
+    names = generator.generate(count=20)
+    assert len(names) == 20
+    with pytest.raises(ValueError):
+        BandNameGenerator(seed=1, fast_mode=False)
+
+
+def test_generator_uses_slots() -> None:
+    """Test generator and fetcher instances carry no per-instance __dict__."""
+    generator = BandNameGenerator()
+    assert not hasattr(generator, "__dict__")
+    assert not hasattr(generator.word_fetcher, "__dict__")
+
+
+def test_generate_does_not_import_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test large batches skip the NumPy path unless NumPy is already imported."""
+    monkeypatch.delitem(sys.modules, "numpy", raising=False)
+    # generate() reads the threshold imported from word_fetcher
+    monkeypatch.setattr(generator_module, "NUMPY_MIN_COUNT", 10)
+    monkeypatch.setattr(BandNameGenerator, "_generate_bulk", None)
+    assert len(BandNameGenerator().generate(count=20)) == 20
+    assert "numpy" not in sys.modules
+
+
+def test_make_assembler_rejects_unsupported_arity() -> None:
+    """Test recipes with a slot count no assembler is written for are refused."""
+    with pytest.raises(ValueError):
+        generator_module._make_assembler("{}", ("noun",))
+
+
+def test_generate_bulk(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the NumPy bulk path produces well-formed names."""
+    pytest.importorskip("numpy")
+    # generate() reads the threshold imported from word_fetcher
+    monkeypatch.setattr(generator_module, "NUMPY_MIN_COUNT", 10)
+    generator = BandNameGenerator()
+    names = generator.generate(count=200)
+    assert len(names) == 200
+    assert all(2 <= len(name.split()) <= 4 for name in names)
+    assert all(word[0].isupper() for name in names for word in name.split())
+    names = generator.generate(pattern=BandNamePattern.THE_ADJECTIVE_NOUN, count=50)
+    assert all(name.startswith("The ") and len(name.split()) == 3 for name in names)
+
+
 def test_pluralize_simple() -> None:
     """Test simple pluralization."""
     generator = BandNameGenerator()
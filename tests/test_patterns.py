@@ -1,6 +1,6 @@
 """Tests for band name patterns."""
 
-from band_name_generator.patterns import BandNamePattern
+from band_name_generator.patterns import MULTI_WORD_PATTERNS, TWO_WORD_PATTERNS, BandNamePattern
 
 
 def test_pattern_enum_exists() -> None:
@@ -11,17 +11,17 @@ def test_pattern_enum_exists() -> None:
 
 
 def test_multi_word_patterns() -> None:
-    """Test multi_word_patterns returns a list."""
+    """Test multi_word_patterns returns a tuple."""
     patterns = BandNamePattern.multi_word_patterns()
-    assert isinstance(patterns, list)
+    assert isinstance(patterns, tuple)
     assert len(patterns) > 0
     assert all(isinstance(p, BandNamePattern) for p in patterns)
 
 
 def test_two_word_patterns() -> None:
-    """Test two_word_patterns returns a list."""
+    """Test two_word_patterns returns a tuple."""
     patterns = BandNamePattern.two_word_patterns()
-    assert isinstance(patterns, list)
+    assert isinstance(patterns, tuple)
     assert len(patterns) > 0
     assert all(isinstance(p, BandNamePattern) for p in patterns)
 
@@ -31,3 +31,11 @@ def test_two_word_subset_of_multi_word() -> None:
     two_word = set(BandNamePattern.two_word_patterns())
     multi_word = set(BandNamePattern.multi_word_patterns())
     assert two_word.issubset(multi_word)
+
+
+def test_pattern_groups_are_cached() -> None:
+    """Test pattern groups are built once and reused."""
+    assert BandNamePattern.multi_word_patterns() is BandNamePattern.multi_word_patterns()
+    assert BandNamePattern.two_word_patterns() is BandNamePattern.two_word_patterns()
+    assert BandNamePattern.multi_word_patterns() is MULTI_WORD_PATTERNS
+    assert BandNamePattern.two_word_patterns() is TWO_WORD_PATTERNS
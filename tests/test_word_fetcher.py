@@ -1,6 +1,52 @@
 """Tests for word fetcher module."""
 
-from band_name_generator.word_fetcher import WordFetcher
+import gzip
+import os
+import sys
+import threading
+import urllib.request
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from band_name_generator import word_fetcher
+from band_name_generator.word_fetcher import (
+    WordFetcher,
+    _default_cache_path,
+    _load_cached_wordlist,
+    _store_cached_wordlist,
+)
+
+# The real HTTP helper, for the tests that exercise it with a fake session
+_REAL_HTTP_GET = word_fetcher._http_get
+
+
+@pytest.fixture(autouse=True)
+def offline_word_list(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep every test offline and out of the user's real cache directory.
+
+    Points the disk cache at tmp_path, empties the class-level word cache
+    shared by all WordFetcher instances, and replaces the HTTP request with
+    a canned word list. Returns the disk cache path.
+    """
+
+    def fake_http_get(url: str, headers: dict[str, str]) -> tuple[int, bytes, dict[str, str]]:
+        return 200, b"offline\nwords\n", {}
+
+    path = tmp_path / "cache" / "wordlist.txt"
+    monkeypatch.setattr(word_fetcher, "WORD_LIST_CACHE", path)
+    monkeypatch.setattr(WordFetcher, "_cached_words", None)
+    monkeypatch.setattr(word_fetcher, "_http_get", fake_http_get)
+    return path
+
+
+@pytest.fixture
+def real_http_get(offline_word_list: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the real _http_get, for tests that fake the layer below it."""
+    monkeypatch.setattr(word_fetcher, "_http_get", _REAL_HTTP_GET)
 
 
 def test_word_fetcher_initialization() -> None:
@@ -9,6 +55,13 @@ def test_word_fetcher_initialization() -> None:
     assert fetcher is not None
 
 
+def test_get_fetcher_is_shared() -> None:
+    """Test get_fetcher() returns one instance per verbosity setting."""
+    assert word_fetcher.get_fetcher() is word_fetcher.get_fetcher()
+    assert word_fetcher.get_fetcher(False) is word_fetcher.get_fetcher(verbose=False)
+    assert word_fetcher.get_fetcher(verbose=True) is not word_fetcher.get_fetcher()
+
+
 def test_get_adjective() -> None:
     """Test getting a random adjective."""
     fetcher = WordFetcher()
@@ -25,6 +78,14 @@ def test_get_noun() -> None:
     assert len(noun) > 0
 
 
+def test_get_noun_plural() -> None:
+    """Test getting a random plural noun."""
+    fetcher = WordFetcher()
+    noun = fetcher.get_noun_plural()
+    assert noun in word_fetcher.NOUNS_PLURAL
+    assert noun.endswith(("s", "es", "ies"))
+
+
 def test_get_verb() -> None:
     """Test getting a random verb."""
     fetcher = WordFetcher()
@@ -54,7 +115,7 @@ def test_get_words_single() -> None:
     fetcher = WordFetcher()
     words = fetcher.get_words(count=1)
     assert len(words) == 1
-    assert isinstance(words[0], str)
+    assert words[0] in ("offline", "words")
 
 
 def test_get_words_multiple() -> None:
@@ -62,4 +123,319 @@ def test_get_words_multiple() -> None:
     fetcher = WordFetcher()
     words = fetcher.get_words(count=5)
     assert len(words) == 5
-    assert all(isinstance(word, str) for word in words)
+    assert set(words) <= {"offline", "words"}
+
+
+def test_word_cache_shared_between_instances(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the word list is fetched once and shared by all instances."""
+    calls = []
+
+    def fake_fetch(self: WordFetcher, refresh: bool = False) -> list[str]:
+        calls.append(refresh)
+        return ["shared"]
+
+    monkeypatch.setattr(WordFetcher, "_fetch_word_list", fake_fetch)
+    assert WordFetcher().get_words(count=2) == ["shared", "shared"]
+    assert WordFetcher().get_words(count=1) == ["shared"]
+    assert calls == [False]
+
+
+def test_prefetch_fills_word_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test prefetch=True fills the shared word cache from a background thread."""
+    calls = []
+    fetched = threading.Event()
+
+    def fake_fetch(self: WordFetcher, refresh: bool = False) -> list[str]:
+        calls.append(threading.current_thread())
+        fetched.set()
+        return ["prefetched"]
+
+    monkeypatch.setattr(WordFetcher, "_fetch_word_list", fake_fetch)
+    fetcher = WordFetcher(prefetch=True)
+    assert fetched.wait(timeout=5)
+    assert fetcher.get_words(count=1) == ["prefetched"]
+    assert len(calls) == 1
+    assert calls[0] is not threading.current_thread()
+
+
+def test_get_words_numpy_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test large get_words() counts sampled with NumPy come from the word pool."""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(word_fetcher, "NUMPY_MIN_COUNT", 10)
+    monkeypatch.setattr(WordFetcher, "_cached_words", ())
+    words = WordFetcher().get_words(count=50)
+    assert len(words) == 50
+    assert set(words) <= set(word_fetcher._FALLBACK_WORDS)
+
+
+def test_get_words_seeded_skips_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test seeded get_words() draws are the same whether or not NumPy is loaded."""
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(word_fetcher, "NUMPY_MIN_COUNT", 10)
+    monkeypatch.setattr(WordFetcher, "_cached_words", ())
+    words = WordFetcher(seed=7).get_words(count=50)
+    monkeypatch.delitem(sys.modules, "numpy")
+    assert WordFetcher(seed=7).get_words(count=50) == words
+
+
+def test_word_lists_have_no_duplicates() -> None:
+    """Test no built-in word is listed twice, which would skew sampling."""
+    for category, words in word_fetcher.CATEGORIES.items():
+        assert len(set(words)) == len(words), category
+
+
+def test_sample() -> None:
+    """Test drawing several words from one category at once."""
+    fetcher = WordFetcher()
+    metals = fetcher.sample("metal", 4)
+    assert len(metals) == 4
+    assert all(metal in word_fetcher.METALS for metal in metals)
+    assert all(word[0].isupper() for word in fetcher.sample("noun", 4, capitalized=True))
+    with pytest.raises(ValueError):
+        fetcher.sample("planet", 1)
+
+
+def test_wordlist_cache_round_trip(tmp_path: Path) -> None:
+    """Test the disk cache returns exactly what was stored."""
+    path = tmp_path / "cache" / "wordlist.txt"
+    _store_cached_wordlist(path, ["alpha", "bravo"], {"If-None-Match": '"v1"'})
+    assert _load_cached_wordlist(path) == ["alpha", "bravo"]
+    assert word_fetcher._load_cached_validators(path) == {"If-None-Match": '"v1"'}
+    # Each write's temporary file is gone once it has been moved into place
+    assert sorted(p.name for p in path.parent.iterdir()) == [
+        "wordlist.txt",
+        "wordlist.txt.validators.json",
+    ]
+
+
+def test_wordlist_cache_writers_use_own_temp_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test concurrent stores never share a temporary file."""
+    path = tmp_path / "wordlist.txt"
+    replaced: list[str] = []
+    real_replace = os.replace
+
+    def recording_replace(src: str, dst: Path) -> None:
+        replaced.append(src)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", recording_replace)
+    _store_cached_wordlist(path, ["alpha"], {"If-None-Match": '"v1"'})
+    _store_cached_wordlist(path, ["bravo"], {"If-None-Match": '"v2"'})
+    assert len(set(replaced)) == 4
+    assert _load_cached_wordlist(path) == ["bravo"]
+
+
+def test_wordlist_cache_expired(tmp_path: Path) -> None:
+    """Test a cache file older than the TTL is ignored."""
+    path = tmp_path / "wordlist.txt"
+    _store_cached_wordlist(path, ["alpha"])
+    old = path.stat().st_mtime - 100
+    os.utime(path, (old, old))
+    assert _load_cached_wordlist(path, ttl=50) is None
+    assert _load_cached_wordlist(tmp_path / "missing.txt") is None
+
+
+def test_default_cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the cache lives under $XDG_CACHE_HOME, or ~/.cache if unset or relative."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert _default_cache_path() == tmp_path / "band_name_generator" / "wordlist.txt"
+    monkeypatch.setenv("XDG_CACHE_HOME", "relative/cache")
+    assert _default_cache_path() == Path.home() / ".cache" / "band_name_generator" / "wordlist.txt"
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    assert _default_cache_path() == Path.home() / ".cache" / "band_name_generator" / "wordlist.txt"
+
+
+def test_fetch_word_list_without_home_directory(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a missing home directory disables the disk cache instead of failing."""
+
+    def no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", no_home)
+    monkeypatch.setattr(word_fetcher, "WORD_LIST_CACHE", None)
+    assert _default_cache_path() is None
+    assert WordFetcher()._fetch_word_list() == ["offline", "words"]
+
+
+def test_fetch_word_list_uses_disk_cache(
+    offline_word_list: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a fresh disk cache is served without hitting the network."""
+    _store_cached_wordlist(offline_word_list, ["cached", "words"])
+    monkeypatch.setattr(word_fetcher, "_http_get", None)
+    fetcher = WordFetcher()
+    assert fetcher._fetch_word_list() == ["cached", "words"]
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests.Response."""
+
+    def __init__(
+        self, content: bytes, status_code: int = 200, headers: dict[str, str] | None = None
+    ) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+# Fake requests.Session.get(): called with the URL and the request's keyword
+# arguments (timeout, headers)
+_FakeGet = Callable[..., FakeResponse]
+
+
+@pytest.fixture
+def fake_session(
+    real_http_get: None, monkeypatch: pytest.MonkeyPatch
+) -> Callable[[_FakeGet], None]:
+    """Return a function that routes requests through a fake session.
+
+    Call it with the fake get() the shared session should use; requests is
+    then treated as installed, whether or not it is.
+    """
+
+    def install(get: _FakeGet) -> None:
+        monkeypatch.setattr(word_fetcher, "_SESSION", SimpleNamespace(get=get))
+        monkeypatch.setattr(word_fetcher, "REQUESTS_AVAILABLE", True)
+
+    return install
+
+
+def test_fetch_word_list_filters_remote_words(
+    offline_word_list: Path, fake_session: Callable[[_FakeGet], None]
+) -> None:
+    """Test remote words are filtered to 4-12 alphabetic characters and cached."""
+    body = b"abc\nWords\nvalid\nit's\nextraordinarily\r\nmountain\r\n"
+
+    def fake_get(url: str, **kwargs: Any) -> FakeResponse:
+        return FakeResponse(body)
+
+    fake_session(fake_get)
+    fetcher = WordFetcher()
+    assert fetcher._fetch_word_list() == ["words", "valid", "mountain"]
+    assert _load_cached_wordlist(offline_word_list) == ["words", "valid", "mountain"]
+
+
+def test_fetch_word_list_revalidates_expired_cache(
+    offline_word_list: Path, fake_session: Callable[[_FakeGet], None]
+) -> None:
+    """Test an expired cache is revalidated with its ETag and reused on 304."""
+    path = offline_word_list
+    requests_made: list[dict[str, str]] = []
+
+    def fake_get(url: str, **kwargs: Any) -> FakeResponse:
+        requests_made.append(kwargs["headers"])
+        if kwargs["headers"]:
+            return FakeResponse(b"", status_code=304)
+        return FakeResponse(b"fresh\nwords\n", headers={"ETag": '"v1"'})
+
+    fake_session(fake_get)
+    fetcher = WordFetcher()
+    assert fetcher._fetch_word_list() == ["fresh", "words"]
+
+    # Expire the cache: the next fetch is conditional and the 304 renews it
+    os.utime(path, (0, 0))
+    assert fetcher._fetch_word_list() == ["fresh", "words"]
+    assert requests_made == [{}, {"If-None-Match": '"v1"'}]
+    assert _load_cached_wordlist(path) == ["fresh", "words"]
+
+
+def test_fetch_word_list_keeps_expired_cache_on_empty_body(
+    offline_word_list: Path, fake_session: Callable[[_FakeGet], None]
+) -> None:
+    """Test a response with no valid words returns the expired cache."""
+
+    def fake_get(url: str, **kwargs: Any) -> FakeResponse:
+        return FakeResponse(b"<html>Sign in to Wi-Fi</html>\n")
+
+    _store_cached_wordlist(offline_word_list, ["stale", "words"])
+    os.utime(offline_word_list, (0, 0))
+    fake_session(fake_get)
+    assert WordFetcher()._fetch_word_list() == ["stale", "words"]
+
+
+def test_fetch_word_list_falls_back_to_expired_cache(
+    offline_word_list: Path, fake_session: Callable[[_FakeGet], None]
+) -> None:
+    """Test a failed fetch returns the expired cache instead of nothing."""
+    import requests
+
+    def fake_get(url: str, **kwargs: Any) -> FakeResponse:
+        raise requests.ConnectionError("offline")
+
+    _store_cached_wordlist(offline_word_list, ["stale", "words"])
+    os.utime(offline_word_list, (0, 0))
+    fake_session(fake_get)
+    assert WordFetcher()._fetch_word_list() == ["stale", "words"]
+
+
+class FakeUrlopenResponse:
+    """Minimal stand-in for the response returned by urllib.request.urlopen()."""
+
+    def __init__(self, content: bytes, headers: dict[str, str]) -> None:
+        self.content = content
+        self.headers = headers
+        self.status = 200
+
+    def __enter__(self) -> FakeUrlopenResponse:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def read(self) -> bytes:
+        return self.content
+
+
+def test_fetch_word_list_without_requests(
+    offline_word_list: Path, monkeypatch: pytest.MonkeyPatch, real_http_get: None
+) -> None:
+    """Test the word list is fetched with urllib, gzip included, if requests is missing."""
+    sent: list[urllib.request.Request] = []
+
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> FakeUrlopenResponse:
+        sent.append(request)
+        body = gzip.compress(b"gzipped\nwords\n")
+        return FakeUrlopenResponse(body, {"Content-Encoding": "gzip", "ETag": '"v2"'})
+
+    monkeypatch.setattr(word_fetcher, "REQUESTS_AVAILABLE", False)
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    assert WordFetcher()._fetch_word_list() == ["gzipped", "words"]
+    assert sent[0].get_header("Accept-encoding") == "gzip"
+    assert word_fetcher._load_cached_validators(offline_word_list) == {"If-None-Match": '"v2"'}
+
+
+def test_fetch_word_list_with_broken_requests(
+    monkeypatch: pytest.MonkeyPatch, real_http_get: None
+) -> None:
+    """Test urllib is used when requests is installed but fails to import."""
+
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> FakeUrlopenResponse:
+        return FakeUrlopenResponse(b"urllib\nwords\n", {})
+
+    # A None entry in sys.modules makes "import requests" raise ImportError
+    monkeypatch.setitem(sys.modules, "requests", None)
+    monkeypatch.setattr(word_fetcher, "_SESSION", None)
+    monkeypatch.setattr(word_fetcher, "REQUESTS_AVAILABLE", True)
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    assert WordFetcher()._fetch_word_list() == ["urllib", "words"]
+    assert word_fetcher.REQUESTS_AVAILABLE is False
+
+
+def test_fetch_word_list_without_requests_bad_gzip(
+    monkeypatch: pytest.MonkeyPatch, real_http_get: None
+) -> None:
+    """Test a truncated gzip body is treated as a failed fetch, not an error."""
+
+    def fake_urlopen(request: urllib.request.Request, timeout: float) -> FakeUrlopenResponse:
+        body = gzip.compress(b"gzipped\nwords\n")[:-8]
+        return FakeUrlopenResponse(body, {"Content-Encoding": "gzip"})
+
+    monkeypatch.setattr(word_fetcher, "REQUESTS_AVAILABLE", False)
+    monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+    assert WordFetcher()._fetch_word_list() == []